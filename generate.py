@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Accountability Calendars CLI - generates printable 10-week tracking calendars as PDFs."""
 
+import functools
+import itertools
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 
 from fpdf import FPDF
 
@@ -10,24 +12,73 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 # Allow OUTPUT_DIR to be overridden via environment variable
 OUTPUT_DIR = os.environ.get("CALENDAR_OUTPUT_DIR", os.path.join(SCRIPT_DIR, "output"))
 
+# File written by the CLI, holding one page per selected calendar
+COMBINED_FILENAME = "Accountability Calendars.pdf"
+
 DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
 
 # Font
 FONT_FAMILY = "Helvetica"
 
+# Date labels: a 5pt-high text line, 5pt below the top of each day cell
+DATE_FONT_SIZE = 7
+DATE_CELL_H = 5
+DATE_CELL_OFFSET = 5
+# fpdf2's cell() puts the text baseline at y + h/2 + this factor * font size
+_FPDF_BASELINE_FACTOR = 0.3
+
 # Header colors (RGB)
 COLOR_LIGHT_BLUE = (173, 216, 230)
 COLOR_PEACH = (255, 218, 185)
 
+# Page layout (points): landscape letter, 10 week rows below a header row
+PAGE_W = 11 * 72  # 792 pt
+PAGE_H = 8.5 * 72  # 612 pt
+MARGIN = 20
+HEADER_H = 20
+ROW_H = (PAGE_H - 2 * MARGIN - HEADER_H) / 10
+
+
+def _scale(raw_widths):
+    """Scale raw column widths proportionally so they span the page between the margins."""
+    scale = (PAGE_W - 2 * MARGIN) / sum(raw_widths)
+    return tuple(w * scale for w in raw_widths)
+
+
+# Column widths for the two calendar layouts (Week #, Mon-Sun, optional TOTAL)
+_GEOM_WITH_TOTAL = _scale((40,) + (90,) * 7 + (80,))
+_GEOM_NO_TOTAL = _scale((40,) + (100,) * 7)
+# Left edge of each column (the final entry is the right edge of the table)
+_X_OFFSETS_WITH_TOTAL = tuple(itertools.accumulate(_GEOM_WITH_TOTAL, initial=MARGIN))
+_X_OFFSETS_NO_TOTAL = tuple(itertools.accumulate(_GEOM_NO_TOTAL, initial=MARGIN))
+
+
+def _date_char_widths(size):
+    """Return the width in points of each character that can appear in an MM/DD date label."""
+    pdf = FPDF(unit="pt")
+    pdf.set_font(FONT_FAMILY, "", size)
+    # Same per-glyph metrics get_string_width sums internally
+    return {c: pdf.current_font.cw[c] * size / 1000 for c in "0123456789/"}
+
+
+# Date labels are always 7pt regular, so their widths can be looked up instead of measured
+_DIGIT_W_7PT = _date_char_widths(DATE_FONT_SIZE)
+
+
+@functools.lru_cache(maxsize=1)
+def _next_monday_for(today_date):
+    """Get the Monday on or after today_date, as a datetime at midnight."""
+    # weekday() returns 0 for Monday
+    days_ahead = (7 - today_date.weekday()) % 7
+    return datetime.combine(today_date + timedelta(days=days_ahead), time())
+
 
 def get_next_monday():
     """Get the next Monday from today (or today if it's already Monday)."""
-    today = datetime.today()
-    # weekday() returns 0 for Monday
-    days_ahead = (7 - today.weekday()) % 7
-    return today + timedelta(days=days_ahead)
+    return _next_monday_for(date.today())
 
 
+@functools.lru_cache(maxsize=32)
 def validate_date(date_str):
     """Validate date string is MM/DD/YYYY format and a Monday. Returns datetime or raises ValueError."""
     try:
@@ -41,157 +92,204 @@ def validate_date(date_str):
 
 def generate_week_dates(start_date):
     """Generate a list of 10 weeks of dates. Each week is a list of 7 datetime objects (Mon-Sun)."""
-    weeks = []
-    for week_num in range(10):
-        week_start = start_date + timedelta(weeks=week_num)
-        week = [week_start + timedelta(days=d) for d in range(7)]
-        weeks.append(week)
-    return weeks
+    days = [start_date + timedelta(days=d) for d in range(70)]
+    return [days[i:i + 7] for i in range(0, 70, 7)]
 
 
 def format_date(dt):
     """Format a datetime as MM/DD (no leading zeros stripped)."""
-    return dt.strftime("%m/%d")
+    # Direct integer formatting; avoids strftime's locale-aware format parsing
+    return f"{dt.month:02d}/{dt.day:02d}"
 
 
-def _draw_header_row(pdf, x_start, y_start, col_widths, headers, has_total):
+def _draw_header_row(pdf, y_start, col_widths, col_x, headers, has_total):
     """Draw the color-coded header row."""
-    x = x_start
-    row_h = 20
+    # All column headers are blue
+    pdf.set_fill_color(*COLOR_LIGHT_BLUE)
 
     for i, (header, w) in enumerate(zip(headers, col_widths)):
-        # All column headers are blue
-        pdf.set_fill_color(*COLOR_LIGHT_BLUE)
+        pdf.rect(col_x[i], y_start, w, HEADER_H, "FD")
+        pdf.set_xy(col_x[i], y_start)
+        pdf.cell(w, HEADER_H, header, align="C")
 
-        pdf.rect(x, y_start, w, row_h, "FD")
-        pdf.set_xy(x, y_start)
-        pdf.cell(w, row_h, header, align="C")
-        x += w
 
+def _emit_raw(pdf, ops):
+    """Write a pre-built, newline-separated block of PDF operators to the current page.
 
-def _draw_week_row(pdf, x_start, y, col_widths, week_num, week_dates, row_h,
-                   has_total, total_content=None, workout_labels=None):
-    """Draw a single week row with date labels and optional content."""
-    x = x_start
+    Used for whole-table blocks (all grid borders) as well as per-row ones (date labels).
+    """
+    pdf._out(ops)
 
-    # Week number column
-    pdf.set_fill_color(*COLOR_PEACH)
-    pdf.rect(x, y, col_widths[0], row_h, "FD")
-    pdf.set_xy(x, y)
-    pdf.cell(col_widths[0], row_h, str(week_num), align="C")
-    x += col_widths[0]
-
-    # Day columns
-    for day_idx in range(7):
-        w = col_widths[1 + day_idx]
-        pdf.rect(x, y, w, row_h, "D")
-
-        # Date in top-right corner
-        date_str = format_date(week_dates[day_idx])
-        pdf.set_font(FONT_FAMILY, "", 7)
-        date_w = pdf.get_string_width(date_str)
-        pdf.set_xy(x + w - date_w - 1, y + 5)
-        pdf.cell(date_w, 5, date_str, align="R")
-
-        # Workout label centered in cell (if applicable)
-        if workout_labels:
-            pdf.set_font(FONT_FAMILY, "", 9)
-            pdf.set_xy(x, y + 5)
-            pdf.cell(w, row_h - 5, workout_labels[day_idx], align="C")
-
-        x += w
-
-    # TOTAL column (if applicable)
-    if has_total:
-        w = col_widths[-1]
-        pdf.rect(x, y, w, row_h, "D")
-        if total_content:
-            pdf.set_font(FONT_FAMILY, "", 8)
-            line_h = row_h / len(total_content)
-            for li, line in enumerate(total_content):
-                pdf.set_xy(x + 2, y + li * line_h)
-                pdf.cell(w - 4, line_h, line, align="L")
-        x += w
-
-
-def _create_calendar_pdf(filename, headers, col_widths, week_dates_list,
-                         has_total, total_content_fn=None, workout_labels=None):
-    """Create a landscape letter-size PDF calendar."""
-    pdf = FPDF(orientation="L", unit="pt", format="letter")
-    pdf.add_page()
-    pdf.set_auto_page_break(auto=False)
 
-    page_w = 11 * 72  # 792 pt
-    page_h = 8.5 * 72  # 612 pt
-    margin = 20
+def _raw_font_op(pdf, size):
+    """Select the regular font at `size` and return its `Tf` operator for raw output.
 
-    total_col_w = page_w - 2 * margin
-    # Scale col_widths to fit
-    raw_total = sum(col_widths)
-    scale = total_col_w / raw_total
-    col_widths = [w * scale for w in col_widths]
+    Going through fpdf keeps the font registered on the page and its notion of
+    the current font in sync with what the raw stream actually selects.
+    """
+    pdf.set_font(FONT_FAMILY, "", size)
+    return pdf._set_font_for_page(pdf.current_font, size)
 
-    header_h = 20
-    row_h = (page_h - 2 * margin - header_h) / 10
 
-    x_start = margin
-    y_start = margin
+def _draw_week_grid(pdf, row_ys, col_widths, col_x, row_h):
+    """Draw the cell borders for every week row in a single content stream block.
 
-    # Draw header
-    pdf.set_font(FONT_FAMILY, "B", 10)
-    _draw_header_row(pdf, x_start, y_start, col_widths, headers, has_total)
+    row_ys holds the top y of each week row. All filled Week # cells go first and
+    the outlined day/TOTAL cells after, so the fill color only has to be set once
+    per page. The caller sets the fill color.
+    """
+    # Raw operators use fpdf's bottom-left origin
+    pdf_ys = [pdf.h - y - row_h for y in row_ys]
 
-    # Draw week rows
+    ops = [f"{col_x[0]:.2f} {y_pdf:.2f} {col_widths[0]:.2f} {row_h:.2f} re B"
+           for y_pdf in pdf_ys]
+    ops += [f"{col_x[i]:.2f} {y_pdf:.2f} {col_widths[i]:.2f} {row_h:.2f} re S"
+            for y_pdf in pdf_ys for i in range(1, len(col_widths))]
+    _emit_raw(pdf, "\n".join(ops))
+
+
+def _draw_date_labels(pdf, row_ys, col_widths, col_x, date_labels):
+    """Draw every date label on the page as one raw block with a single font selection.
+
+    date_labels holds the preformatted MM/DD strings for all rows, 7 per row.
+    """
+    # Dates in the top-right corner of each day cell, placed where a right-aligned
+    # DATE_CELL_H-high `cell` at (x + w - date_w - 1, y + DATE_CELL_OFFSET) would put them
+    ops = [_raw_font_op(pdf, DATE_FONT_SIZE)]
+    text_color = pdf.text_color.serialize().lower()
+    for week_idx, y in enumerate(row_ys):
+        ty = pdf.h - (y + DATE_CELL_OFFSET + DATE_CELL_H / 2
+                      + _FPDF_BASELINE_FACTOR * DATE_FONT_SIZE)
+        for day_idx in range(7):
+            date_str = date_labels[7 * week_idx + day_idx]
+            date_w = sum(_DIGIT_W_7PT[c] for c in date_str)
+            tx = col_x[1 + day_idx] + col_widths[1 + day_idx] - date_w - 1 - pdf.c_margin
+            ops.append(f"q {text_color} BT {tx:.2f} {ty:.2f} Td ({date_str}) Tj ET Q")
+    _emit_raw(pdf, "\n".join(ops))
+
+
+def _draw_week_numbers(pdf, row_ys, col_widths, col_x, row_h):
+    """Draw the number of every week, centered in the Week # column."""
+    # Week number column, always 10pt
     pdf.set_font(FONT_FAMILY, "", 10)
-    for week_idx, week_dates in enumerate(week_dates_list):
-        y = y_start + header_h + week_idx * row_h
-        total_content = total_content_fn(week_idx) if total_content_fn else None
-        _draw_week_row(pdf, x_start, y, col_widths, week_idx + 1, week_dates,
-                       row_h, has_total, total_content, workout_labels)
+    for week_idx, y in enumerate(row_ys):
+        pdf.set_xy(col_x[0], y)
+        pdf.cell(col_widths[0], row_h, str(week_idx + 1), align="C")
+
+
+def _draw_workout_labels(pdf, row_ys, col_widths, col_x, row_h, workout_labels):
+    """Draw the workout labels centered below the date in every day cell."""
+    pdf.set_font(FONT_FAMILY, "", 9)
+    for y in row_ys:
+        for day_idx in range(7):
+            pdf.set_xy(col_x[1 + day_idx], y + 5)
+            pdf.cell(col_widths[1 + day_idx], row_h - 5, workout_labels[day_idx], align="C")
+
+
+def _draw_total_content(pdf, row_ys, col_widths, col_x, row_h, total_content_fn):
+    """Draw the TOTAL column lines returned by total_content_fn(week_idx) for every week."""
+    x = col_x[len(col_widths) - 1]
+    w = col_widths[-1]
+    pdf.set_font(FONT_FAMILY, "", 8)
+    for week_idx, y in enumerate(row_ys):
+        total_content = total_content_fn(week_idx)
+        if not total_content:
+            continue
+        line_h = row_h / len(total_content)
+        for li, line in enumerate(total_content):
+            pdf.set_xy(x + 2, y + li * line_h)
+            pdf.cell(w - 4, line_h, line, align="L")
+
+
+def _new_shared_pdf():
+    """Return an empty landscape letter-size FPDF document, ready for calendar pages."""
+    pdf = FPDF(orientation="L", unit="pt", format="letter")
+    pdf.set_auto_page_break(auto=False)
+    pdf.set_font(FONT_FAMILY, "", 10)
+    return pdf
+
 
+def _save_pdf(pdf, filename):
+    """Write pdf to OUTPUT_DIR/filename and return the file path."""
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     filepath = os.path.join(OUTPUT_DIR, filename)
     pdf.output(filepath)
     return filepath
 
 
-def generate_pages_read(start_date, goal):
-    """Generate the Pages Read calendar PDF."""
+def _create_calendar_pdf(filename, headers, col_widths, col_x, week_dates_list,
+                         has_total, total_content_fn=None, workout_labels=None,
+                         pdf=None):
+    """Create a landscape letter-size PDF calendar.
+
+    col_widths and col_x are one of the precomputed layouts, e.g.
+    `_GEOM_WITH_TOTAL` and `_X_OFFSETS_WITH_TOTAL`.
+
+    If pdf is given, the calendar is added to it as a new page and nothing is
+    written (returns None); otherwise it is saved on its own as filename.
+    """
+    standalone = pdf is None
+    if standalone:
+        pdf = _new_shared_pdf()
+    pdf.add_page()
+
+    # Draw header
+    pdf.set_font(FONT_FAMILY, "B", 10)
+    _draw_header_row(pdf, MARGIN, col_widths, col_x, headers, has_total)
+
+    # Draw all week row borders; the Week # column is the only filled cell
+    row_ys = [MARGIN + HEADER_H + week_idx * ROW_H for week_idx in range(len(week_dates_list))]
+    pdf.set_fill_color(*COLOR_PEACH)
+    _draw_week_grid(pdf, row_ys, col_widths, col_x, ROW_H)
+
+    # Draw the row text one font size at a time, formatting every date label in one pass
+    date_labels = [format_date(dt) for week_dates in week_dates_list for dt in week_dates]
+    _draw_date_labels(pdf, row_ys, col_widths, col_x, date_labels)
+    _draw_week_numbers(pdf, row_ys, col_widths, col_x, ROW_H)
+    if workout_labels:
+        _draw_workout_labels(pdf, row_ys, col_widths, col_x, ROW_H, workout_labels)
+    if has_total and total_content_fn:
+        _draw_total_content(pdf, row_ys, col_widths, col_x, ROW_H, total_content_fn)
+
+    if standalone:
+        return _save_pdf(pdf, filename)
+    return None
+
+
+def generate_pages_read(start_date, goal, pdf=None):
+    """Generate the Pages Read calendar PDF, or add it as a page of pdf if given."""
     headers = ["Week"] + DAY_NAMES + ["TOTAL"]
-    col_widths = [40] + [90] * 7 + [80]
     week_dates_list = generate_week_dates(start_date)
 
     def total_content(week_idx):
         return [f"Goal: {goal}", "Actual:"]
 
-    return _create_calendar_pdf("Pages Read.pdf", headers, col_widths,
-                                week_dates_list, has_total=True,
-                                total_content_fn=total_content)
+    return _create_calendar_pdf("Pages Read.pdf", headers, _GEOM_WITH_TOTAL,
+                                _X_OFFSETS_WITH_TOTAL, week_dates_list, has_total=True,
+                                total_content_fn=total_content, pdf=pdf)
 
 
-def generate_project_hours(start_date):
-    """Generate the Project Hours calendar PDF."""
+def generate_project_hours(start_date, pdf=None):
+    """Generate the Project Hours calendar PDF, or add it as a page of pdf if given."""
     headers = ["Week"] + DAY_NAMES + ["TOTAL"]
-    col_widths = [40] + [90] * 7 + [80]
     week_dates_list = generate_week_dates(start_date)
 
     def total_content(week_idx):
         return ["Hours This Week:", "Debt:"]
 
-    return _create_calendar_pdf("Project Hours.pdf", headers, col_widths,
-                                week_dates_list, has_total=True,
-                                total_content_fn=total_content)
+    return _create_calendar_pdf("Project Hours.pdf", headers, _GEOM_WITH_TOTAL,
+                                _X_OFFSETS_WITH_TOTAL, week_dates_list, has_total=True,
+                                total_content_fn=total_content, pdf=pdf)
 
 
-def generate_workouts(start_date, workout_labels):
-    """Generate the Workouts calendar PDF."""
+def generate_workouts(start_date, workout_labels, pdf=None):
+    """Generate the Workouts calendar PDF, or add it as a page of pdf if given."""
     headers = ["Week"] + DAY_NAMES
-    col_widths = [40] + [100] * 7
     week_dates_list = generate_week_dates(start_date)
 
-    return _create_calendar_pdf("Workouts.pdf", headers, col_widths,
-                                week_dates_list, has_total=False,
-                                workout_labels=workout_labels)
+    return _create_calendar_pdf("Workouts.pdf", headers, _GEOM_NO_TOTAL,
+                                _X_OFFSETS_NO_TOTAL, week_dates_list, has_total=False,
+                                workout_labels=workout_labels, pdf=pdf)
 
 
 def prompt_date():
@@ -274,14 +372,17 @@ def main():
 
     print("\nGenerating calendars...")
 
+    # All calendars share one document, one page each
+    pdf = _new_shared_pdf()
     for cal in calendars:
         if cal == "Pages Read":
-            path = generate_pages_read(start_date, goal)
+            generate_pages_read(start_date, goal, pdf=pdf)
         elif cal == "Project Hours":
-            path = generate_project_hours(start_date)
+            generate_project_hours(start_date, pdf=pdf)
         elif cal == "Workouts":
-            path = generate_workouts(start_date, workout_labels)
-        print(f"  Created: {path}")
+            generate_workouts(start_date, workout_labels, pdf=pdf)
+    path = _save_pdf(pdf, COMBINED_FILENAME)
+    print(f"  Created: {path}")
 
     print("\nDone!")
 
@@ -1,11 +1,13 @@
 """Unit tests for generate.py"""
 
 import os
+import re
 import shutil
 import tempfile
-from datetime import datetime
+from datetime import date, datetime
 
 import pytest
+from fpdf import FPDF
 
 from generate import (
     validate_date,
@@ -48,6 +50,19 @@ class TestValidateDate:
             validate_date("not-a-date")
 
 
+# --- Next Monday ---
+
+class TestNextMonday:
+    def test_monday_returns_same_day(self):
+        assert generate._next_monday_for(date(2026, 3, 2)) == datetime(2026, 3, 2)
+
+    def test_midweek_returns_following_monday(self):
+        assert generate._next_monday_for(date(2026, 3, 4)) == datetime(2026, 3, 9)
+
+    def test_sunday_crosses_year_boundary(self):
+        assert generate._next_monday_for(date(2028, 12, 31)) == datetime(2029, 1, 1)
+
+
 # --- Date calculation ---
 
 class TestWeekDates:
@@ -107,8 +122,127 @@ class TestPDFGeneration:
         assert os.path.isfile(path)
         assert path.endswith("Workouts.pdf")
 
+    def test_shared_pdf_gets_one_page_per_calendar(self, tmp_output):
+        start = datetime(2026, 3, 2)
+        labels = ["4 Miles", "Weights", "Rest", "4 Miles", "Weights", "Rest", "Rest"]
+        pdf = generate._new_shared_pdf()
+        assert generate_pages_read(start, 100, pdf=pdf) is None
+        assert generate_project_hours(start, pdf=pdf) is None
+        assert generate_workouts(start, labels, pdf=pdf) is None
+        assert pdf.pages_count == 3
+        # Nothing is written until the caller saves the shared document
+        assert not os.path.exists(tmp_output)
+
+    def test_main_writes_one_combined_pdf(self, tmp_output, monkeypatch, capsys):
+        # Next Monday, all calendars, a page goal, then the 7 workout labels
+        answers = iter(["1", "4", "100"] + ["Rest"] * 7)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+        generate.main()
+
+        # Only the combined file is written, not the per-calendar filenames
+        assert os.listdir(tmp_output) == [generate.COMBINED_FILENAME]
+        path = os.path.join(tmp_output, generate.COMBINED_FILENAME)
+        with open(path, "rb") as f:
+            data = f.read()
+        assert len(re.findall(rb"/Type /Page\b", data)) == 3
+        assert f"Created: {path}" in capsys.readouterr().out
+
+    def test_date_label_widths_match_fpdf(self):
+        pdf = FPDF(unit="pt")
+        pdf.set_font(generate.FONT_FAMILY, "", 7)
+        for date_str in ("03/02", "12/25", "11/11", "01/05"):
+            cached = sum(generate._DIGIT_W_7PT[c] for c in date_str)
+            assert cached == pytest.approx(pdf.get_string_width(date_str))
+
     def test_output_directory_created(self, tmp_output):
         assert not os.path.exists(tmp_output)
         start = datetime(2026, 3, 2)
         generate_pages_read(start, 100)
         assert os.path.isdir(tmp_output)
+
+
+# --- Raw content stream ---
+
+RECT_RE = re.compile(r"(-?[\d.]+) (-?[\d.]+) (-?[\d.]+) (-?[\d.]+) re [SB]")
+DATE_TD_RE = re.compile(r"BT ([\d.]+) ([\d.]+) Td (?:0 g )?\((\d\d/\d\d)\) Tj")
+
+
+def _uncompressed_page():
+    pdf = generate._new_shared_pdf()
+    pdf.set_compression(False)
+    pdf.add_page()
+    return pdf
+
+
+def _page_ops(pdf):
+    return bytes(pdf.pages[pdf.page].contents).decode("latin1")
+
+
+def _rects(ops):
+    """Return rectangles as (x, bottom, w, h), whichever corner the operator used."""
+    rects = []
+    for x, y, w, h in RECT_RE.findall(ops):
+        x, y, w, h = float(x), float(y), float(w), float(h)
+        rects.append((x, min(y, y + h), w, abs(h)))
+    return rects
+
+
+class TestRawContentStream:
+    widths = generate._GEOM_WITH_TOTAL
+    col_x = generate._X_OFFSETS_WITH_TOTAL
+    y = generate.MARGIN + generate.HEADER_H
+    labels = ["03/02", "03/03", "03/04", "03/05", "03/06", "03/07", "03/08"]
+
+    def test_grid_rects_match_pdf_rect(self):
+        pdf = _uncompressed_page()
+        generate._draw_week_grid(pdf, [self.y], self.widths, self.col_x, generate.ROW_H)
+
+        ref = _uncompressed_page()
+        for x, w in zip(self.col_x, self.widths):
+            ref.rect(x, self.y, w, generate.ROW_H, "D")
+
+        actual, expected = _rects(_page_ops(pdf)), _rects(_page_ops(ref))
+        assert len(actual) == len(expected) == len(self.widths)
+        for a, e in zip(actual, expected):
+            assert a == pytest.approx(e, abs=0.011)
+
+    def test_date_label_positions_match_pdf_cell(self):
+        pdf = _uncompressed_page()
+        generate._draw_date_labels(pdf, [self.y], self.widths, self.col_x, self.labels)
+
+        ref = _uncompressed_page()
+        ref.set_font(generate.FONT_FAMILY, "", 7)
+        for day_idx, date_str in enumerate(self.labels):
+            date_w = ref.get_string_width(date_str)
+            ref.set_xy(self.col_x[1 + day_idx] + self.widths[1 + day_idx] - date_w - 1,
+                       self.y + 5)
+            ref.cell(date_w, 5, date_str, align="R")
+
+        actual = DATE_TD_RE.findall(_page_ops(pdf))
+        expected = DATE_TD_RE.findall(_page_ops(ref))
+        assert [a[2] for a in actual] == self.labels
+        for (ax, ay, _), (ex, ey, _) in zip(actual, expected):
+            assert float(ax) == pytest.approx(float(ex), abs=0.011)
+            assert float(ay) == pytest.approx(float(ey), abs=0.011)
+
+    @pytest.mark.parametrize("generate_fn", [
+        lambda start, pdf: generate_pages_read(start, 100, pdf=pdf),
+        lambda start, pdf: generate_workouts(start, ["Rest"] * 7, pdf=pdf),
+    ])
+    def test_one_font_selection_per_text_pass(self, generate_fn):
+        pdf = generate._new_shared_pdf()
+        pdf.set_compression(False)
+        generate_fn(datetime(2026, 3, 2), pdf)
+        # Header, date labels, week numbers, then TOTAL lines or workout labels
+        assert _page_ops(pdf).count(" Tf") == 4
+
+    def test_raw_font_registered_on_each_page(self):
+        pdf = generate._new_shared_pdf()
+        pdf.set_compression(False)
+        for _ in range(2):
+            pdf.add_page()
+            generate._emit_raw(pdf, generate._raw_font_op(pdf, 7))
+        font_ref = f"/F{pdf.current_font.i} "
+        resources = re.findall(r"/Font <<(.*?)>>", bytes(pdf.output()).decode("latin1"), re.S)
+        assert len(resources) == 2
+        assert all(font_ref in r for r in resources)